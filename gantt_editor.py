@@ -464,6 +464,7 @@ class MainWindow(QMainWindow):
             if window.exec() == QMessageBox.StandardButton.Yes:
                 self.canvas.clear()
                 self.image = None
+                self.figure.invalidate()
                 self.image = self.figure.draw(self.loader)
                 self.update_canvas_image()
                 return
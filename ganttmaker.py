@@ -1,11 +1,17 @@
 import datetime
+import functools
+import importlib.util
+from dataclasses import astuple, dataclass
 import sys
+import numpy as np
 import pandas as pd
 import os
 from PySide6.QtGui import QImage, QPainter, QPen, QFont, QGuiApplication, QColor, QBrush, QPainterPath, QPixmap, \
-    QFontMetrics
-from PySide6.QtCore import Qt, QObject
-from PySide6.QtWidgets import QApplication
+    QFontMetricsF, QStaticText
+from PySide6.QtCore import Qt, QObject, QLine, QPointF, QRect
+
+# python-calamine parses .xlsx files natively and is much faster than openpyxl, so it is used if installed
+_EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
 
 _units = {
     'pt': 1,  # 1 point is 1 point
@@ -18,7 +24,182 @@ _units = {
 # color palette: https://www.learnui.design/tools/data-color-picker.html#palette
 _colors = ["#003f5c", "#2f4b7c", "#665191", "#a05195", "#d45087", "#f95d6a", "#ff7c43", "#ffa600"]
 
+# palette as QColor objects, built once and copied where a color needs its own alpha
+_palette = tuple(QColor(color) for color in _colors)
+
+# pixel format of rendered images, premultiplied alpha is the format Qt's raster engine paints and blends natively
+_LAYER_FMT = QImage.Format.Format_ARGB32_Premultiplied
+
+# pixel format of rendered images with an opaque background, which skips all work on the alpha channel
+_OPAQUE_FMT = QImage.Format.Format_RGB32
+
+# columns of the Excel file that hold dates in the format dd.mm.yyyy
+_DATE_COLUMNS = ('Plan-Start', 'Actual-Start', 'Plan-End', 'Actual-End')
+
+# below this number of tasks the rectangles are computed in plain Python, NumPy's fixed cost per call dominates there
+_SMALL_TASK_COUNT = 32
+
+# application instance created by _ensure_app, kept at module level so it lives as long as drawn pixmaps
+_app: QGuiApplication | None = None
+
+
+def _ensure_app() -> QGuiApplication:
+    """
+    Function that returns the running QGuiApplication or creates one on first use.
+    A created application uses the offscreen platform plugin unless the user chose another one,
+    because rendering is headless. It is kept for all following draws.
+
+    Returns:
+        QGuiApplication: application instance
+    """
+    global _app
+    if _app is None:
+        _app = QGuiApplication.instance()
+        if _app is None:
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+            _app = QGuiApplication(sys.argv)
+    return _app
+
+# font metrics per QFont.key() and logical DPI of the measured device, built by _font_metrics
+_font_metrics_cache: dict[tuple[str, int, int], QFontMetricsF] = {}
+
+
+def _font_metrics(font: QFont, device) -> QFontMetricsF:
+    """
+    Function that returns the metrics of a font on a paint device. Metrics are built once per font description
+    and device resolution and reused.
+
+    Parameters:
+        font: QFont, font to measure
+        device: QPaintDevice, device the font is drawn on
+
+    Returns:
+        QFontMetricsF: metrics of the font on the device
+    """
+    key = (font.key(), device.logicalDpiX(), device.logicalDpiY())
+    metrics = _font_metrics_cache.get(key)
+    if metrics is None:
+        metrics = QFontMetricsF(font, device)
+        _font_metrics_cache[key] = metrics
+    return metrics
+
+
+def _line_height(metrics: QFontMetricsF) -> int:
+    """
+    Function that returns the line height QFontMetrics.height reports for the same font and device.
+
+    Parameters:
+        metrics: QFontMetricsF, metrics of the font
+
+    Returns:
+        int: height of a line in pixels
+    """
+    return round(metrics.ascent()) + round(metrics.descent())
+
+# laid out axis labels per text and QFont.key(), built by _static_text
+# only weekday, day and month labels are kept here, their number is bounded by the calendar
+_static_text_cache: dict[tuple[str, str], QStaticText] = {}
+
+
+def _new_static_text(text: str) -> QStaticText:
+    """
+    Function that creates a static text whose layout is kept after the first draw.
+
+    Parameters:
+        text: str, text to draw
+
+    Returns:
+        QStaticText: static text
+    """
+    static_text = QStaticText(text)
+    static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+    return static_text
+
+
+def _static_text(text: str, font: QFont) -> QStaticText:
+    """
+    Function that returns a static text of an axis label for the given font.
+    Static texts are built once per text and font description and reused, their layout is kept after the first draw.
+    Texts that depend on the loaded data must not be cached here, the cache is never cleared.
+
+    Parameters:
+        text: str, text to draw
+        font: QFont, font the text is drawn with
+
+    Returns:
+        QStaticText: static text
+    """
+    key = (text, font.key())
+    static_text = _static_text_cache.get(key)
+    if static_text is None:
+        static_text = _new_static_text(text)
+        _static_text_cache[key] = static_text
+    return static_text
+
+
+def _compute_rects(starts: np.ndarray, ends: np.ndarray, task_width: int, task_height: int, fx: int, fy: int,
+                   hpad: int, vpad: int, n_colors: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function that computes the geometry of all task rectangles from their day offsets.
+    Row i is placed at the i-th task height below the figure start.
+
+    Parameters:
+        starts: np.ndarray, first day of each task relative to the start date
+        ends: np.ndarray, last day of each task relative to the start date
+        task_width: int, width of a day
+        task_height: int, height of a task
+        fx: int, x-coordinate of the figure start
+        fy: int, y-coordinate of the figure start
+        hpad: int, horizontal padding
+        vpad: int, vertical padding
+        n_colors: int, number of colors in the palette
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: x, y, width and palette index of each rectangle
+    """
+    rows = np.arange(len(starts), dtype=np.int32)
+    xs = (fx + hpad + task_width * starts).astype(np.int32)
+    ys = fy + vpad + task_height * rows
+    widths = (task_width * (ends - starts + 1)).astype(np.int32)
+    color_indices = rows % n_colors
+    return xs, ys, widths, color_indices
+
 
+def _compute_arrows(pred_rows: np.ndarray, task_rows: np.ndarray, slots: np.ndarray, slot_counts: np.ndarray,
+                    start_days: np.ndarray, end_days: np.ndarray, t_width: int, t_height: int, x0: int,
+                    y0: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function that computes the geometry of all dependency arrows.
+    An arrow starts in the middle of the last day of the predecessor and ends at the start of the task.
+    A task with several predecessors splits its height into one slot per predecessor.
+    If the predecessor ends on the day the task starts, the arrow ends in the middle of that day.
+
+    Parameters:
+        pred_rows: np.ndarray, row of the predecessor of each arrow
+        task_rows: np.ndarray, row of the task of each arrow
+        slots: np.ndarray, position of the predecessor among the predecessors of the task
+        slot_counts: np.ndarray, number of predecessors of the task
+        start_days: np.ndarray, last day of the predecessor relative to the start date
+        end_days: np.ndarray, first day of the task relative to the start date
+        t_width: int, width of a day
+        t_height: int, height of a task
+        x0: int, x-coordinate of the first day
+        y0: int, y-coordinate of the first row
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: start x, start y, end x, end y and
+        whether the predecessor ends on the start day of the task
+    """
+    same_days = start_days == end_days
+    x_starts = x0 + (start_days + 1) * t_width - t_width / 2
+    y_starts = y0 + pred_rows * t_height + t_height / 2
+    x_ends = np.where(same_days, x0 + end_days * t_width + t_width / 2, x0 + end_days * t_width)
+    slot_heights = t_height / slot_counts
+    y_ends = y0 + task_rows * t_height + slots * slot_heights + slot_heights / 2
+    return x_starts, y_starts, x_ends, y_ends, same_days
+
+
+@dataclass(slots=True)
 class RenderMetrics:
     title_height: int = 50
     title_padding: int = 10
@@ -43,6 +224,8 @@ class RenderElementProperties(QObject):
         self._line_color: QColor = QColor('black')
         self._line_style: Qt.PenStyle = Qt.PenStyle.SolidLine
         self._brush: QBrush = QBrush(QColor('transparent'))
+        self._pen: QPen | None = None
+        self._version: int = 0
 
     @staticmethod
     def penstyle_from_str(style: str) -> Qt.PenStyle:
@@ -89,6 +272,7 @@ class RenderElementProperties(QObject):
         if width < 0:
             raise ValueError("box_width must be a positive float")
         self._line_width = width
+        self._invalidate()
 
     @property
     def line_color(self) -> QColor:
@@ -108,6 +292,7 @@ class RenderElementProperties(QObject):
             except Exception:
                 raise TypeError("box_color must be a QColor object")
         self._line_color = color
+        self._invalidate()
 
     @property
     def line_style(self) -> Qt.PenStyle:
@@ -126,6 +311,7 @@ class RenderElementProperties(QObject):
         elif not isinstance(style, Qt.PenStyle):
             raise TypeError("linestyle must be a Qt.PenStyle object, not a "+str(type(style)))
         self._line_style = style
+        self._invalidate()
 
     @property
     def brush(self) -> QBrush:
@@ -145,11 +331,28 @@ class RenderElementProperties(QObject):
             except ValueError:
                 raise TypeError("brush must be a QBrush object or convertible")
         self._brush = brush
+        self._invalidate()
 
     @property
     def pen(self) -> QPen:
-        return QPen(self._line_color, self._line_width, self._line_style)
+        """
+        Property that holds the pen built from line color, width and style.
+        The pen is built once and shared until one of them changes, so it must be copied before it is modified.
+
+        Returns:
+            QPen: pen
+        """
+        if self._pen is None:
+            self._pen = QPen(self._line_color, self._line_width, self._line_style)
+        return self._pen
 
+    def _invalidate(self):
+        """
+        Hook that is called whenever a property changes. Subclasses drop derived objects here.
+        The version is increased, so renderers can tell whether cached drawings are still valid.
+        """
+        self._pen = None
+        self._version += 1
 
 
 class TaskProperties(RenderElementProperties):
@@ -159,6 +362,55 @@ class TaskProperties(RenderElementProperties):
         self._alpha_actual = 127
         self._alpha_plan = 0
         self._corner_radius = 0
+        self._style_cache: dict[tuple[int, int], tuple[QPen, QBrush]] = {}
+
+    def _invalidate(self):
+        super()._invalidate()
+        self._style_cache.clear()
+
+    def task_style(self, index: int, plan: bool) -> tuple[QPen, QBrush]:
+        """
+        Method that returns pen and brush of a task colored by the palette.
+        The pen uses the palette color, the brush additionally the alpha value of plan or actual data.
+        Both are built once per palette index and reused until a property changes.
+
+        Parameters:
+            index: int, index of the task
+            plan: bool, if True, the alpha value of the plan is used, otherwise the one of the actual data
+
+        Returns:
+            tuple[QPen, QBrush]: pen and brush of the task
+        """
+        return self._palette_style(index, self._alpha_plan if plan else self._alpha_actual)
+
+    def merged_task_style(self, index: int) -> tuple[QPen, QBrush]:
+        """
+        Method that returns pen and brush of a task whose actual data equals the plan.
+        The brush alpha is the result of painting the actual brush over the plan brush,
+        so a single rectangle looks like both drawn on top of each other.
+
+        Parameters:
+            index: int, index of the task
+
+        Returns:
+            tuple[QPen, QBrush]: pen and brush of the task
+        """
+        alpha = self._alpha_actual + round(self._alpha_plan * (255 - self._alpha_actual) / 255)
+        return self._palette_style(index, alpha)
+
+    def _palette_style(self, index: int, alpha: int) -> tuple[QPen, QBrush]:
+        key = (index % len(_colors), alpha)
+        style = self._style_cache.get(key)
+        if style is None:
+            pen = QPen(self.pen)
+            pen.setColor(_palette[key[0]])
+            brush_color = QColor(_palette[key[0]])
+            brush_color.setAlpha(alpha)
+            brush = QBrush(self._brush)
+            brush.setColor(brush_color)
+            style = (pen, brush)
+            self._style_cache[key] = style
+        return style
 
     @property
     def corner_radius(self) -> float:
@@ -203,6 +455,7 @@ class TaskProperties(RenderElementProperties):
         if alpha < 0 or alpha > 255:
             raise ValueError("alpha_actual must be between 0 and 255")
         self._alpha_actual = alpha
+        self._invalidate()
 
     @alpha_plan.setter
     def alpha_plan(self, alpha: int):
@@ -211,6 +464,7 @@ class TaskProperties(RenderElementProperties):
         if alpha < 0 or alpha > 255:
             raise ValueError("alpha_plan must be between 0 and 255")
         self._alpha_plan = alpha
+        self._invalidate()
 
 
 class FontProperties(RenderElementProperties):
@@ -235,6 +489,7 @@ class FontProperties(RenderElementProperties):
         if not isinstance(font, QFont):
             raise TypeError("font must be a QFont object")
         self._font = font
+        self._invalidate()
 
     @property
     def text(self) -> str:
@@ -253,10 +508,16 @@ class FontProperties(RenderElementProperties):
         except ValueError:
             raise ValueError("text must be a string")
         self._text = text
+        self._invalidate()
 
 class TitleProperties(FontProperties):
-    def __init__(self):
+    def __init__(self, render_metrics: RenderMetrics | None = None):
+        """
+        Class that holds the properties of the title text.
+        Setting the font updates the title_height of the given render metrics.
+        """
         super().__init__(None)
+        self._render_metrics: RenderMetrics | None = render_metrics
 
     @property
     def font(self) -> QFont:
@@ -273,12 +534,19 @@ class TitleProperties(FontProperties):
         if not isinstance(font, QFont):
             raise TypeError("font must be a QFont object")
         self._font = font
+        self._invalidate()
         fontsize = self._font.pointSize()
-        RenderMetrics.title_height = fontsize + 5
+        if self._render_metrics is not None:
+            self._render_metrics.title_height = fontsize + 5
 
 class AxesProperties(FontProperties):
-    def __init__(self):
+    def __init__(self, render_metrics: RenderMetrics | None = None):
+        """
+        Class that holds the properties of the axes text.
+        Setting the font updates the axis_height of the given render metrics.
+        """
         super().__init__(None)
+        self._render_metrics: RenderMetrics | None = render_metrics
 
     @property
     def font(self) -> QFont:
@@ -295,8 +563,10 @@ class AxesProperties(FontProperties):
         if not isinstance(font, QFont):
             raise TypeError("font must be a QFont object")
         self._font = font
+        self._invalidate()
         fontsize = self._font.pointSize()
-        RenderMetrics.axis_height = fontsize * 2
+        if self._render_metrics is not None:
+            self._render_metrics.axis_height = fontsize * 2
 
 def validate_columns(data: pd.DataFrame):
     """
@@ -315,6 +585,26 @@ def validate_columns(data: pd.DataFrame):
         raise ValueError("Column 'Predecessor' missing")
 
 
+@functools.lru_cache(maxsize=8)
+def _read_data(file: str, modified: float) -> pd.DataFrame:
+    """
+    Function that reads and validates the data of an Excel file and converts its date columns.
+    Results are kept per absolute path and modification time, so a file is only parsed again after it was changed.
+    The returned DataFrame is shared and must be copied before it is handed out.
+
+    Parameters:
+        file: str, absolute path to the Excel file
+        modified: float, modification time of the file
+
+    Returns:
+        pandas.DataFrame: data of the file
+    """
+    data = pd.read_excel(file, engine=_EXCEL_ENGINE, dtype={'Task': str, 'Predecessor': str})
+    validate_columns(data)
+    data[list(_DATE_COLUMNS)] = data[list(_DATE_COLUMNS)].apply(pd.to_datetime, format='%d.%m.%Y')
+    return data
+
+
 class Dataloader:
     _file: str | None = None
 
@@ -344,23 +634,31 @@ class Dataloader:
         """
         self.file = file_string
         self._data = None
+        self._version = 0
 
     def load(self):
         """
         Method that loads the data from the Excel file into a pandas.DataFrame object.
+        The file is read with python-calamine if it is installed, otherwise with openpyxl.
+        A file that was not modified since it was last read is not parsed again.
         """
-        data = pd.read_excel(self.file, engine='openpyxl', dtype={'Task': str, 'Predecessor': str})
-        validate_columns(data)
-        data['Plan-Start'] = pd.to_datetime(data['Plan-Start'], format='%d.%m.%Y')
-        data['Actual-Start'] = pd.to_datetime(data['Actual-Start'], format='%d.%m.%Y')
-        data['Plan-End'] = pd.to_datetime(data['Plan-End'], format='%d.%m.%Y')
-        data['Actual-End'] = pd.to_datetime(data['Actual-End'], format='%d.%m.%Y')
-        self._data = data
+        self._data = _read_data(os.path.abspath(self.file), os.path.getmtime(self.file)).copy()
+        self._version += 1
 
     @property
     def data(self):
         return self._data
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Releases the loaded data when the loader is used as a context manager.
+        The workbook itself is closed right after reading, so only the DataFrame is held until then.
+        """
+        self._data = None
+
 
 class Figure:
     def __init__(self):
@@ -416,7 +714,9 @@ class Figure:
         self.arrow_properties.line_style = Qt.PenStyle.SolidLine
         self.arrow_properties.brush = QBrush(QColor('black'))
 
-        self.title_properties: TitleProperties = TitleProperties()
+        self.render_metrics = RenderMetrics()
+
+        self.title_properties = TitleProperties(self.render_metrics)
         self.title_properties.line_color = QColor('black')
         self.title_properties.line_width = 2.0
         self.title_properties.line_style = Qt.PenStyle.SolidLine
@@ -443,7 +743,7 @@ class Figure:
         self.grid_properties.line_style = Qt.PenStyle.DotLine
         self.grid_properties.brush = QBrush(QColor('transparent'))
 
-        self.axes_properties: AxesProperties = AxesProperties()
+        self.axes_properties = AxesProperties(self.render_metrics)
         self.axes_properties.line_color = QColor(_colors[0])
         self.axes_properties.line_width = 1.0
         self.axes_properties.line_style = Qt.PenStyle.SolidLine
@@ -471,11 +771,83 @@ class Figure:
 
         self._background_color: QColor = QColor('transparent')
         self._export_file: str | None = 'gantt_diagram.png'
+        self._debug: bool = False
         self._start_date: datetime.date | None = None
         self._canvas_size: tuple[int, int] | None = None
         self._unit: float = _units['px']
         self._loader: 'Dataloader' | None = None
-        self.render_metrics: RenderMetrics = RenderMetrics()
+        self._data_cache: dict[tuple[str, str], object] = {}
+        self._data_cache_source: tuple | None = None
+        self._grid_tile_cache: dict[bool, tuple[tuple, QPixmap]] = {}
+        self._static_layer_cache: dict[tuple, QImage] = {}
+        self._draw_cache: tuple[tuple, QPixmap] | None = None
+        self._legend_source: tuple | None = None
+        self._legend_static: list[QStaticText] = []
+        self._legend_sizes: list[float] = []
+        self._arrow_styles_cache: tuple[tuple[int, int], list[tuple[QPen, QBrush]]] | None = None
+
+    @property
+    def render_metrics(self) -> RenderMetrics:
+        """
+        Property that holds the dimensions used to lay out the figure.
+        The title and axes properties of the figure update these metrics when their font is set.
+
+        Returns:
+            RenderMetrics: render metrics of the figure
+        """
+        return self._render_metrics
+
+    @render_metrics.setter
+    def render_metrics(self, render_metrics: RenderMetrics):
+        if not isinstance(render_metrics, RenderMetrics):
+            raise TypeError("render_metrics must be a RenderMetrics object")
+        self._render_metrics = render_metrics
+        if hasattr(self, '_title_properties'):
+            self._title_properties._render_metrics = render_metrics
+        if hasattr(self, '_axes_properties'):
+            self._axes_properties._render_metrics = render_metrics
+
+    @property
+    def title_properties(self) -> TitleProperties:
+        """
+        Property that holds the properties of the title.
+        Assigned properties set title_height from their font and are bound to the render metrics of the figure,
+        so their font keeps updating title_height.
+
+        Returns:
+            TitleProperties: title properties
+        """
+        return self._title_properties
+
+    @title_properties.setter
+    def title_properties(self, properties: TitleProperties):
+        if not isinstance(properties, TitleProperties):
+            raise TypeError("title_properties must be a TitleProperties object")
+        # the title band follows the font of the assigned properties, as setting their font does
+        self.render_metrics.title_height = properties.font.pointSize() + 5
+        properties._render_metrics = self.render_metrics
+        self._title_properties = properties
+
+    @property
+    def axes_properties(self) -> AxesProperties:
+        """
+        Property that holds the properties of the axes.
+        Assigned properties set axis_height from their font and are bound to the render metrics of the figure,
+        so their font keeps updating axis_height.
+
+        Returns:
+            AxesProperties: axes properties
+        """
+        return self._axes_properties
+
+    @axes_properties.setter
+    def axes_properties(self, properties: AxesProperties):
+        if not isinstance(properties, AxesProperties):
+            raise TypeError("axes_properties must be an AxesProperties object")
+        # the axis band follows the font of the assigned properties, as setting their font does
+        self.render_metrics.axis_height = properties.font.pointSize() * 2
+        properties._render_metrics = self.render_metrics
+        self._axes_properties = properties
 
     @property
     def background_color(self) -> QColor:
@@ -548,50 +920,102 @@ class Figure:
 
     @canvas_size.setter
     def canvas_size(self, size: tuple[int, int]):
-        if len(size) == 2:
-            self._canvas_size = tuple([int(x * self.unit) for x in size])
-        else:
+        try:
+            width, height = size
+        except ValueError:
             raise ValueError("canvas_size must be a tuple of two integers")
+        self._canvas_size = (int(width * self.unit), int(height * self.unit))
 
     @property
     def export_file(self):
         """
         Property that holds the path to the export file.
+        If it is None, draw does not write the chart to a file.
 
         Returns:
-            str: path to the export file
+            str | None: path to the export file
         """
         return self._export_file
 
     @export_file.setter
-    def export_file(self, file: str):
+    def export_file(self, file: str | None):
         self._export_file = file
 
+    @property
+    def debug(self) -> bool:
+        """
+        Property that holds whether every intermediate layer is saved as PNG file to the working directory.
+
+        Returns:
+            bool: True if the layers are saved
+        """
+        return self._debug
+
+    @debug.setter
+    def debug(self, debug: bool):
+        if not isinstance(debug, bool):
+            raise TypeError("debug must be a boolean")
+        self._debug = debug
+
     @staticmethod
-    def set_painter_renderoptions(painter):
-        pass
-        #painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        #painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    def set_painter_renderoptions(painter, antialiasing: bool = False):
+        """
+        Method that sets the render hints of a painter.
+        Axis-aligned rectangles and lines gain nothing from antialiasing but double the fill cost,
+        so it is only enabled on request for curved shapes. Text is always antialiased.
+
+        Parameters:
+            painter: QPainter object to configure
+            antialiasing: bool, if True, shapes are antialiased
+        """
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
         #painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
+    def reset(self):
+        """
+        Method that drops the loader and everything cached by previous draws.
+        Settings and properties are kept, so the figure can be reused for another loader without holding on to the
+        data and images of the last one.
+        """
+        self._loader = None
+        self._data_cache.clear()
+        self._data_cache_source = None
+        self._static_layer_cache.clear()
+        self._grid_tile_cache.clear()
+        self._draw_cache = None
+        self._arrow_styles_cache = None
+        self._legend_source = None
+        self._legend_static = []
+        self._legend_sizes = []
+
     def draw(self, loader: Dataloader) -> QPixmap:
         """
         First perform guard checks.
         Second loads data using Dataloader instance.
-        Third creates a new or gets an existing QApplication instance.
-        Then the image is rendered:
+        Third makes sure a QGuiApplication instance exists, one is created offscreen on the first draw if needed.
+        If no export file is set and neither the data nor any setting changed since the previous draw, its chart is
+        returned without rendering. A chart with an export file is always rendered, so the file is written and its
+        creation time is current. Changes are detected by the data version of the loader and the
+        versions of the properties objects, so data edited in place or a font, pen or brush modified through a getter
+        are not noticed, call invalidate after such changes.
+        Then the image is rendered. All layers are drawn directly onto a single canvas image in their stacking order,
+        using one painter that stays active for the whole render:
         1.) Calculate the start coordinates as well as width and height of the figure box.
         2.) Calculate the height and width of a day of a task.
-        3.) Draw the box layer
-        4.) Draw the title layer
-        5.) Draw the legend layer
-        6.) Draw the grid layer
-        7.) Draw time hints for the beginning of the week and month
-        8.) Draw the planned tasks
-        9.) Draw the actual tasks
-        10.) Draw the axis layer
-        11.) Draw the arrows
-        12.) Combine all layers
+        3.) Create the canvas image and fill it with the background color
+        4.) Draw the box layer
+        5.) Draw the title layer
+        Steps 3.) to 5.) only depend on the figure geometry and their properties, so their result is cached.
+        It is copied onto a new canvas image, which has no alpha channel if the background color is opaque.
+        6.) Draw the legend layer
+        7.) Draw the grid layer
+        8.) Draw the axis layer
+        9.) Draw time hints for the beginning of the week and month
+        10.) Draw the planned tasks
+        11.) Draw the actual tasks, together with the planned ones in a single pass
+        12.) Draw the arrows
+        The export file is written before draw returns. The intermediate layers are only written if debug is enabled.
 
         Parameters:
             loader: Dataloader object that contains the data to be drawn
@@ -613,10 +1037,12 @@ class Figure:
             self._loader.load()
 
         # Third
-        if not QGuiApplication.instance():
-            app = QApplication(sys.argv)
-        else:
-            app = QApplication.instance()
+        _ensure_app()
+        # without an export, the chart of the previous draw is returned as is if neither the data nor a setting changed
+        # an export is always rendered again, so the file exists and carries the time it was created
+        draw_key = self._draw_key()
+        if not self.export_file and self._draw_cache is not None and self._draw_cache[0] == draw_key:
+            return self._draw_cache[1]
         # 1.)
         figure_start: tuple[int, int] = self._define_drawing_start()
         figure_width = self.canvas_size[0] - figure_start[0] - self.render_metrics.horizontal_padding
@@ -629,254 +1055,353 @@ class Figure:
         task_height: int = self._define_task_height(figure_height)
         task_width: int = self._define_task_width(figure_width)
 
-        # draw image layers
-        # 3.)
-        box_layer = self.draw_box_layer(figure_start, figure_width, figure_height)
-        box_layer.save('0_box_layer.png')
-        # 4.)
-        title_layer = self.draw_title()
-        title_layer.save('1_title_layer.png')
-        # 5.)
-        legend_layer = self.draw_legend(figure_start, task_height)
-        legend_layer.save('2_legend_layer.png')
-        # 6.)
-        grid_layer = self.draw_grid_layer(figure_start, task_width, task_height, figure_width, 'Plan-End')
-        grid_layer.save('3_grid_layer.png')
-        # 7.)
-        monday_layer = self.draw_monday_lines(figure_start, task_width, 'Plan-End')
-        monday_layer.save('4_monday_layer.png')
-        # 8.)
-        graph_layer = self.draw_tasks(figure_start, task_height, task_width, 'Plan-Start', 'Plan-End')
-        graph_layer.save('5_graph_layer.png')
-        # 9.)
-        actual_layer = self.draw_tasks(figure_start, task_height, task_width, 'Actual-Start', 'Actual-End', plan=False)
-        actual_layer.save('6_actual_layer.png')
-        # 10.)
-        axes_layer = self.draw_xaxis(figure_start, figure_height, task_width,'Plan-End')
-        axes_layer.save('7_axes_layer.png')
-        # 11.)
-        arrows_layer = self.draw_arrows(figure_start, task_width, task_height)
-        arrows_layer.save('8_arrows_layer.png')
-
-        # 12.)
-        image = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        image.fill(self.background_color)
-        painter = QPainter()
-        painter.begin(image)
-        painter.drawImage(0, 0, box_layer)
-        #image.save('combined_0.png')
-        painter.drawImage(0, 0, title_layer)
-        #image.save('combined_1.png')
-        painter.drawImage(0, 0, legend_layer)
-        #image.save('combined_2.png')
-        painter.drawImage(0, 0, grid_layer)
-        #image.save('combined_3.png')
-        painter.drawImage(0, 0, axes_layer)
-        #image.save('combined_4.png')
-        painter.drawImage(0, 0, monday_layer)
-        #image.save('combined_5.png')
-        painter.drawImage(0, 0, graph_layer)
-        #image.save('combined_6.png')
-        painter.drawImage(0, 0, actual_layer)
-        #image.save('combined_7.png')
-        painter.drawImage(0, 0, arrows_layer)
-        #image.save('combined_8.png')
-        painter.end()
-
-        # save image
-        image.save(self.export_file)
-        return QPixmap.fromImage(image.copy())
-
-    def draw_arrows(self, start, t_width, t_height):
+        # 3.) to 5.)
+        static_layer = self._static_layer(figure_start, figure_width, figure_height)
+        # written on every draw, the static layer may come from the cache
+        self._save_debug_layer(static_layer, '0_box_layer.png')
+        # a new canvas is allocated on every draw, the returned pixmap shares the buffer of the previous one
+        image = QImage(static_layer.size(), static_layer.format())
+
+        # draw image layers with a single painter that stays active on the canvas
+        painter = QPainter(image)
+        try:
+            # the static layer replaces the uninitialized pixels of the canvas
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawImage(0, 0, static_layer)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+            self._save_debug_layer(image, '1_title_layer.png')
+            # 6.)
+            self.draw_legend(painter, figure_start, task_height)
+            self._save_debug_layer(image, '2_legend_layer.png')
+            # 7.)
+            self.draw_grid_layer(painter, figure_start, task_width, task_height, figure_width, 'Plan-End')
+            self._save_debug_layer(image, '3_grid_layer.png')
+            # 8.)
+            self.draw_xaxis(painter, figure_start, figure_height, task_width, 'Plan-End')
+            self._save_debug_layer(image, '4_axes_layer.png')
+            # 9.)
+            self.draw_monday_lines(painter, figure_start, task_width, 'Plan-End')
+            self._save_debug_layer(image, '5_monday_layer.png')
+            # 10.) and 11.)
+            # bars may overrun the box into the padding, so only bars outside the canvas and its outline are skipped
+            margin = int(self.task_properties.pen.widthF()) + 1
+            viewport = image.rect().adjusted(-margin, -margin, margin, margin)
+            self.draw_data_layers_combined(painter, figure_start, task_height, task_width, viewport)
+            self._save_debug_layer(image, '6_graph_layer.png')
+            # 12.)
+            self.draw_arrows(painter, figure_start, task_width, task_height)
+            self._save_debug_layer(image, '8_arrows_layer.png')
+        finally:
+            painter.end()
+
+        # save image, the canvas is not painted on anymore, so the pixmap shares it instead of copying
+        if self.export_file:
+            image.save(self.export_file)
+        pixmap = QPixmap.fromImage(image)
+        self._draw_cache = None if self.export_file else (draw_key, pixmap)
+        return pixmap
+
+    def invalidate(self):
+        """
+        Method that forces the next draw to render the chart again, even if no setting or data version changed.
+        It must be called after the loaded DataFrame was edited in place, or after a font, pen or brush of a
+        properties object was modified through its getter instead of being assigned.
+        """
+        self._draw_cache = None
+
+    def _draw_key(self) -> tuple:
+        """
+        Method that returns a key identifying everything the drawn chart depends on.
+        It holds the loaded data version, the figure settings, the render metrics and the version of every properties
+        object, so any change to them leads to a new key.
+
+        Returns:
+            tuple: key of the chart
+        """
+        properties = (self.arrow_properties, self.title_properties, self.legend_properties, self.box_properties,
+                      self.grid_properties, self.axes_properties, self.week_highlight_properties,
+                      self.month_highlight_properties, self.task_properties)
+        return (id(self._loader), self._loader._version, self.start_date, self.canvas_size, self._unit,
+                self.background_color.rgba(), self.export_file, self._debug, astuple(self.render_metrics),
+                tuple((id(element), element._version) for element in properties))
+
+    def _static_layer(self, figure_start: tuple[int, int], figure_width: int, figure_height: int) -> QImage:
+        """
+        Method that returns an image holding the background, the box and the title.
+        The image is rendered again only when the geometry, the background color or the box and title properties
+        change. Only the image of the last geometry is kept.
+
+        Parameters:
+            figure_start: tuple[int, int], starting point of the figure
+            figure_width: int, width of the figure
+            figure_height: int, height of the figure
+
+        Returns:
+            QImage: image to be copied as base of the canvas, must not be painted on
+        """
+        # properties are identified by object and version, a replaced object may have the same version
+        key = (self.canvas_size, figure_start, figure_width, figure_height, self.background_color.rgba(),
+               id(self.box_properties), self.box_properties._version,
+               id(self.title_properties), self.title_properties._version,
+               self.render_metrics.title_padding, self.render_metrics.title_height,
+               self.render_metrics.horizontal_padding)
+        image = self._static_layer_cache.get(key)
+        if image is None:
+            # an opaque background never needs an alpha channel, so the chart is painted without one
+            image_format = _LAYER_FMT if self.background_color.alpha() < 255 else _OPAQUE_FMT
+            image = QImage(self.canvas_size[0], self.canvas_size[1], image_format)
+            image.fill(self.background_color)
+            painter = QPainter(image)
+            try:
+                self.draw_box_layer(painter, figure_start, figure_width, figure_height)
+                self.draw_title(painter)
+            finally:
+                painter.end()
+            self._static_layer_cache.clear()
+            self._static_layer_cache[key] = image
+        return image
+
+    def _save_debug_layer(self, image: QImage, file: str):
+        """
+        Method that saves a snapshot of the canvas if debug is enabled, otherwise nothing is encoded.
+
+        Parameters:
+            image: QImage, canvas to take the snapshot from
+            file: str, path of the file
+        """
+        if self._debug:
+            image.save(file)
+
+    def draw_arrows(self, painter: QPainter, start, t_width, t_height):
         """
         Method that draws arrows at the end of each task.
-        Creates a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with pen and brush from the arrow_properties and set hints for rendering.
         Iterating over the data, the predecessors of each task are determined.
         If a task has predecessors, the start and end date of the predecessor are determined.
-        The x and y coordinates of the predecessor are calculated.
+        Arrows from a predecessor without an actual end or to a task without an actual start are skipped.
+        The coordinates of all arrows are calculated at once with _compute_arrows.
         A circle is drawn at the end of the predecessor.
         A vertical line is drawn from the end of the predecessor to the y-coordinate of the task.
         A horizontal line to the beginning of the task is drawn.
         An arrow head is drawn at the end of the horizontal line.
+        Arrows share the color of their predecessor, the dots, lines and heads of one color are drawn in batches.
         If the end date of the predecessor is the same as the start date of the task,
         the horizontal line will basically not be visible and the arrow will always face down.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             start: tuple[int, int], starting point of the figure
             t_width: int, width of a task
             t_height: int, height of a task
-
-        Returns:
-            QImage: arrows layer
         """
-
-        arrowslayer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter = QPainter()
-        painter.begin(arrowslayer)
+        painter.save()
         painter.setPen(self.arrow_properties.pen)
         painter.setBrush(self.arrow_properties.brush)
-        for i, task in enumerate(self._loader.data.itertuples()):
-            predecessors: list = str(self._loader.data['Predecessor'].loc[i]).split(';')
-            if predecessors[0] != 'nan':
+        data = self._loader.data
+        # resolve columns once as plain lists, dates as day offsets since the start date
+        predecessor_lists = self._predecessor_lists()
+        actual_starts = self._day_offsets('Actual-Start').tolist()
+        actual_ends = self._day_offsets('Actual-End').tolist()
+        # tasks not started or not finished yet have no actual dates to draw an arrow from or to
+        started = (~self._missing_days('Actual-Start')).tolist()
+        finished = (~self._missing_days('Actual-End')).tolist()
+        # first row of each task with its index label, actual end day and whether it has one
+        rows: dict[str, tuple[int, int, bool]] = {}
+        for label, task, actual_end, done in zip(data.index.tolist(), data['Task'].tolist(), actual_ends, finished):
+            if task not in rows:
+                rows[task] = (label, actual_end, done)
+        arrow_styles = self._arrow_styles()
+        # one entry per arrow: row of the predecessor and the task, position among the task's predecessors
+        pred_rows: list[int] = []
+        task_rows: list[int] = []
+        slots: list[int] = []
+        slot_counts: list[int] = []
+        start_days: list[int] = []
+        end_days: list[int] = []
+        for i, predecessors in enumerate(predecessor_lists):
+            if predecessors and started[i]:
                 # print(predecessors)
-                for j, pred in enumerate(predecessors):
-                    record = self._loader.data[self._loader.data['Task'] == pred]
-                    start_date = record['Actual-End'].iloc[0].date()
-                    end_date = self._loader.data['Actual-Start'][i].date()
-                    x_start = ((start_date - self.start_date).days + 1) * t_width + start[
-                        0] + self.render_metrics.horizontal_padding - t_width / 2
-                    pred_idx = self._loader.data.index[self._loader.data['Task'] == pred].tolist()[0]
-                    y_start = start[1] + self.render_metrics.vertical_padding + pred_idx * t_height + t_height / 2
-                    if start_date == end_date:
-                        x_end = (end_date - self.start_date).days * t_width + start[
-                            0] + self.render_metrics.horizontal_padding + t_width / 2
-                    else:
-                        x_end = (end_date - self.start_date).days * t_width + start[
-                            0] + self.render_metrics.horizontal_padding
-                    if len(predecessors) > 1:
-                        y_end = start[1] + self.render_metrics.vertical_padding + i * t_height + j * (
-                                t_height / len(predecessors)) + (t_height / len(predecessors)) / 2
-                    else:
-                        y_end = start[1] + self.render_metrics.vertical_padding + i * t_height + t_height / 2
-                    circle = 0.1 * t_height
-                    pen = painter.pen()
-                    pen.setColor(QColor(_colors[pred_idx % len(_colors)]))
-                    brush = QBrush(pen.color())
-                    painter.setBrush(brush)
-                    painter.setPen(pen)
-
-                    # define arrow head
-                    arrow_head = QPainterPath()
-                    if start_date == end_date:
-                        arrow_head.moveTo(x_end - circle / 2, y_end - circle * 2)
-                        arrow_head.lineTo(x_end + circle / 2, y_end - circle * 2)
-                        arrow_head.lineTo(x_end, y_end)
-                        arrow_head.closeSubpath()
-                    else:
-                        arrow_head.moveTo(x_end - circle * 2, y_end - circle / 2)
-                        arrow_head.lineTo(x_end - circle * 2, y_end + circle / 2)
-                        arrow_head.lineTo(x_end, y_end)
-                        arrow_head.closeSubpath()
-
-                    # starting dot
-                    painter.drawEllipse(x_start - circle / 2, y_start - circle / 2, circle, circle)
-
-                    # connection lines
-                    painter.drawLine(x_start, y_start, x_start, y_end)
-                    painter.drawLine(x_start, y_end, x_end, y_end)
-
-                    # arrow head
-                    painter.drawPath(arrow_head)
-
-        painter.end()
-        return arrowslayer
-
-    def draw_monday_lines(self, figure_start, task_width, column):
+                count = len(predecessors)
+                for slot, pred in enumerate(predecessors):
+                    pred_idx, start_day, done = rows[pred]
+                    if not done:
+                        continue
+                    # arrows keep their slot among all predecessors, even if some of them are skipped
+                    pred_rows.append(pred_idx)
+                    start_days.append(start_day)
+                    slots.append(slot)
+                    task_rows.append(i)
+                    slot_counts.append(count)
+                    end_days.append(actual_starts[i])
+        x_starts, y_starts, x_ends, y_ends, same_days = _compute_arrows(
+            np.array(pred_rows, dtype=np.int64), np.array(task_rows, dtype=np.int64), np.array(slots, dtype=np.int64),
+            np.array(slot_counts, dtype=np.int64), np.array(start_days, dtype=np.int64),
+            np.array(end_days, dtype=np.int64), t_width, t_height, start[0] + self.render_metrics.horizontal_padding,
+            start[1] + self.render_metrics.vertical_padding)
+        circle = 0.1 * t_height
+        # geometry is collected per palette color, so each color is drawn with a few batched calls
+        dots: dict[int, QPainterPath] = {}
+        lines: dict[int, list[QLine]] = {}
+        heads: dict[int, QPainterPath] = {}
+        for pred_idx, x_start, y_start, x_end, y_end, same_day in zip(
+                pred_rows, x_starts.tolist(), y_starts.tolist(), x_ends.tolist(), y_ends.tolist(), same_days.tolist()):
+            color_index = pred_idx % len(_colors)
+            if color_index not in dots:
+                dots[color_index] = QPainterPath()
+                dots[color_index].setFillRule(Qt.FillRule.WindingFill)
+                lines[color_index] = []
+                heads[color_index] = QPainterPath()
+                heads[color_index].setFillRule(Qt.FillRule.WindingFill)
+
+            # dots and lines snap to whole pixels as the integer drawEllipse and drawLine calls did
+            # starting dot
+            dots[color_index].addEllipse(int(x_start - circle / 2), int(y_start - circle / 2), int(circle), int(circle))
+
+            # connection lines
+            lines[color_index].append(QLine(int(x_start), int(y_start), int(x_start), int(y_end)))
+            lines[color_index].append(QLine(int(x_start), int(y_end), int(x_end), int(y_end)))
+
+            # arrow head
+            arrow_head = heads[color_index]
+            if same_day:
+                arrow_head.moveTo(x_end - circle / 2, y_end - circle * 2)
+                arrow_head.lineTo(x_end + circle / 2, y_end - circle * 2)
+            else:
+                arrow_head.moveTo(x_end - circle * 2, y_end - circle / 2)
+                arrow_head.lineTo(x_end - circle * 2, y_end + circle / 2)
+            arrow_head.lineTo(x_end, y_end)
+            arrow_head.closeSubpath()
+
+        # colors are drawn in the order of their first arrow
+        for color_index in dots:
+            pen, brush = arrow_styles[color_index]
+            painter.setBrush(brush)
+            painter.setPen(pen)
+            painter.drawPath(dots[color_index])
+            painter.drawLines(lines[color_index])
+            painter.drawPath(heads[color_index])
+        painter.restore()
+
+    def _arrow_styles(self) -> list[tuple[QPen, QBrush]]:
+        """
+        Method that returns one pen and brush per palette color, arrows take the color of their predecessor.
+        The styles are cached until the arrow properties change or are replaced.
+
+        Returns:
+            list[tuple[QPen, QBrush]]: pen and brush for each palette color
+        """
+        version = (id(self.arrow_properties), self.arrow_properties._version)
+        if self._arrow_styles_cache is None or self._arrow_styles_cache[0] != version:
+            arrow_styles: list[tuple[QPen, QBrush]] = []
+            for color in _palette:
+                pen = QPen(self.arrow_properties.pen)
+                pen.setColor(color)
+                arrow_styles.append((pen, QBrush(color)))
+            self._arrow_styles_cache = (version, arrow_styles)
+        return self._arrow_styles_cache[1]
+
+    def draw_monday_lines(self, painter: QPainter, figure_start, task_width, column):
         """
         Method that draws vertical lines at the beginning of each week and month.
-        Creates two QPainter objects and two QImage objects using the canvas size.
-        Configure the painter objects with color, pen and brush from the week_highlight_properties and set hints for rendering.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
+        Configure the painter with color, pen and brush from the week_highlight_properties and set hints for rendering.
         A range depending on the maximum date in the data and the start date is calculated.
-        While iterating over this range a vertical line for each week is drawn.
+        The Mondays and first days of a month in this range are found with NumPy in one pass each.
+        The vertical lines for all Mondays are drawn with a single drawLines call.
         Configures the painter for monthly hints with color, pen and brush from the month_highlight_properties and set hints for rendering.
-        While iterating over the range a vertical line for each month is drawn.
+        The vertical lines for all first days of a month are drawn with a single drawLines call.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             figure_start: tuple[int, int], starting point of the figure
             task_width: int that defines the width of a task
             column: str, column of the data that is used to determine the maximum date
         """
-        layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        monday_painter = QPainter()
-        monthly_painter = QPainter()
-        monday_painter.begin(layer)
-        monday_painter.setPen(self.week_highlight_properties.pen)
-        monday_painter.setBrush(self.week_highlight_properties.brush)
-        dates = (self._loader.data[column].max().date() - self.start_date).days + 1
-        for i in range(dates):
-            if (self.start_date + datetime.timedelta(days=i)).weekday() == 0:
-                x = int(figure_start[0] + i * task_width + self.render_metrics.horizontal_padding)
-                monday_painter.drawLine(x, figure_start[1], x,
-                                        self.canvas_size[1] - self.render_metrics.vertical_padding)
-        monday_painter.end()
-        monthly_painter.begin(layer)
-        monthly_painter.setPen(self.month_highlight_properties.pen)
-        monthly_painter.setBrush(self.month_highlight_properties.brush)
-        for i in range(dates):
-            if (self.start_date + datetime.timedelta(days=i)).day == 1:
-                x = int(figure_start[0] + i * task_width + self.render_metrics.horizontal_padding)
-                monthly_painter.drawLine(x, figure_start[1] - self.render_metrics.axis_height, x,
-                                         self.canvas_size[1] - self.render_metrics.vertical_padding)
-        monthly_painter.end()
-        return layer
-
-    def draw_xaxis(self, start, height, task_width, column):
+        painter.save()
+        painter.setPen(self.week_highlight_properties.pen)
+        painter.setBrush(self.week_highlight_properties.brush)
+        month_days = self._month_days(column)
+        days = np.arange(len(month_days))
+        x0 = int(figure_start[0] + self.render_metrics.horizontal_padding)
+        bottom = self.canvas_size[1] - self.render_metrics.vertical_padding
+        mondays = days[(days + self.start_date.weekday()) % 7 == 0]
+        painter.drawLines([QLine(x, figure_start[1], x, bottom) for x in (x0 + mondays * task_width).tolist()])
+        painter.setPen(self.month_highlight_properties.pen)
+        painter.setBrush(self.month_highlight_properties.brush)
+        month_starts = days[month_days == 1]
+        top = figure_start[1] - self.render_metrics.axis_height
+        painter.drawLines([QLine(x, top, x, bottom) for x in (x0 + month_starts * task_width).tolist()])
+        painter.restore()
+
+    def draw_xaxis(self, painter: QPainter, start, height, task_width, column):
         """
         Method that draws the x-axis of the Gantt chart.
-        Creates a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with pen and brush from the axes_properties and set hints for rendering.
         A range depending on the maximum date in the data and the start date is calculated.
         Iterating over this range, x-coordinates are calculated depending on the task_width and figure_start.
+        Days starting beyond the right edge of the canvas are left out.
         The first two letters of the weekday and the day of the month are drawn at the x-coordinates.
         As well as the number of the day in month beneath.
-        If the day is the first of the month, the month and year are drawn as formatted string above the figure.
+        Labels are drawn as cached static texts, so each distinct label is laid out only once.
+        For each first of a month in the range, the month and year are drawn as formatted string above the figure.
         At the end the creation date is drawn at the bottom left of the figure.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             start: tuple[int, int], starting point of the figure
             height: int, height of the figure
             task_width: int, width of a task
             column: str, column of the data to be drawn
-
-        Returns:
-            QImage: axes layer
         """
-        painter = QPainter()
-        axes_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter.begin(axes_layer)
+        painter.save()
         painter.setPen(self.axes_properties.pen)
         painter.setBrush(self.axes_properties.brush)
         painter.setFont(self.axes_properties.font)
-        dates = (self._loader.data[column].max().date() - self.start_date).days + 1
-        for i in range(dates):
-            x = int(start[0]
-                    + i * task_width
-                    + self.render_metrics.horizontal_padding
-                    )
-            y = self.canvas_size[1] - self.render_metrics.vertical_padding - self.render_metrics.axis_height//2
-            date = self.start_date + datetime.timedelta(days=i)
-            text = date.strftime('%A')[0:2]
-            day_text = date.strftime('%d')
-            painter.drawText(
-                x, y,
-                task_width, self.render_metrics.axis_height//2,
-                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom,
-                text
-            )
-            painter.drawText(
-                x, y - self.render_metrics.axis_height//2 - self.render_metrics.axis_padding,
-                task_width, self.render_metrics.axis_height//2 + self.render_metrics.axis_padding,
-                Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
-                day_text
-            )
-            if date.day == 1:
-                metrics = QFontMetrics(self.axes_properties.font)
-                font_width = metrics.horizontalAdvance(date.strftime('%B %Y'))
-                if x + self.render_metrics.horizontal_padding + font_width > self.canvas_size[0]:
-                    continue
-                painter.drawText(
-                    x + self.render_metrics.horizontal_padding,
-                    (start[1]
-                     - self.render_metrics.axis_height
-                     - self.render_metrics.axis_padding
-                     - self.render_metrics.title_padding),
-                    task_width * 30,
-                    (self.render_metrics.axis_height
-                     + self.render_metrics.axis_padding
-                     + self.render_metrics.title_padding),
-                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
-                    date.strftime('%B %Y'))
+        hpad = self.render_metrics.horizontal_padding
+        half_axis = self.render_metrics.axis_height//2
+        axis_padding = self.render_metrics.axis_padding
+        month_top = start[1] - self.render_metrics.axis_height - axis_padding - self.render_metrics.title_padding
+        month_height = self.render_metrics.axis_height + axis_padding + self.render_metrics.title_padding
+        canvas_width = self.canvas_size[0]
+        # days starting beyond the right edge of the canvas would not be visible
+        dates = min(self._last_day(column) + 1,
+                    max(0, (canvas_width - int(start[0] + hpad)) // task_width + 1))
+        xs = (int(start[0] + hpad) + np.arange(dates) * task_width).tolist()
+        y = self.canvas_size[1] - self.render_metrics.vertical_padding - half_axis
+        # weekday names repeat every 7 days, the days of month come from the calendar shared with the time hints
+        weekday_texts = [(self.start_date + datetime.timedelta(days=i)).strftime('%A')[0:2] for i in range(7)]
+        month_days = self._month_days(column)[:dates].tolist()
+        # labels are drawn as static texts, laid out once per text and font and positioned like the aligned rects
+        font = self.axes_properties.font
+        weekday_labels = [_static_text(text, font) for text in weekday_texts]
+        day_labels = {day: _static_text(f'{day:02d}', font) for day in set(month_days)}
+        day_top = y - half_axis - axis_padding
+        # texts are measured on the canvas, so the offsets and the fit check match the layout drawStaticText uses
+        metrics = _font_metrics(font, painter.device())
+        line_height = _line_height(metrics)
+        weekday_top = y + half_axis - line_height
+        month_label_top = month_top + month_height - line_height
+        month_width = task_width * 30
+        weekday_offsets = [(task_width - metrics.horizontalAdvance(text)) / 2 for text in weekday_texts]
+        day_offsets = {day: (task_width - metrics.horizontalAdvance(f'{day:02d}')) / 2 for day in day_labels}
+        for i, (x, month_day) in enumerate(zip(xs, month_days)):
+            # labels are clipped to their day like drawText clips to its rectangle
+            painter.setClipRect(x, y, task_width, half_axis)
+            painter.drawStaticText(QPointF(x + weekday_offsets[i % 7], weekday_top), weekday_labels[i % 7])
+            painter.setClipRect(x, day_top, task_width, half_axis + axis_padding)
+            painter.drawStaticText(QPointF(x + day_offsets[month_day], day_top), day_labels[month_day])
+        # month labels are drawn above the figure at every first of a month, formatted in one batch
+        month_starts = np.flatnonzero(np.asarray(month_days) == 1)
+        month_texts = pd.DatetimeIndex(np.datetime64(self.start_date, 'D') + month_starts).strftime('%B %Y').tolist()
+        for i, month_text in zip(month_starts.tolist(), month_texts):
+            x = xs[i]
+            if x + hpad + metrics.horizontalAdvance(month_text) > canvas_width:
+                continue
+            painter.setClipRect(x + hpad, month_top, month_width, month_height)
+            painter.drawStaticText(QPointF(x + hpad, month_label_top), _static_text(month_text, font))
+        painter.setClipping(False)
         painter.drawText(
             self.render_metrics.horizontal_padding*2,
             self.canvas_size[1] - self.render_metrics.vertical_padding*2 - self.render_metrics.axis_height,
@@ -885,121 +1410,254 @@ class Figure:
             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
             'created: ' + datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         )
-        painter.end()
-
-        return axes_layer
+        painter.restore()
 
-    def draw_tasks(self, figure_start: tuple[int, int], task_height: int, task_width: int, start_column, end_column, plan=True):
+    def draw_tasks(self, painter: QPainter, figure_start: tuple[int, int], task_height: int, task_width: int, start_column,
+                   end_column, plan=True, viewport: QRect | None = None):
         """
         Method that draws the tasks of the Gantt chart.
-        Creates a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with pen and brush from the task_properties and set hints for rendering.
         the colors of the tasks are determined by the index of the task in the dataframe.
         The alpha value of the plan and actual data is set in the task_properties.
-        For each task in the dataframe a rectangle is drawn with the start and end date of the task.
+        For each task in the dataframe a rectangle is built from the start and end date of the task.
         The height is determined by the task_height.
+        Rectangles sharing a color are drawn with a single drawRects call.
+        Rectangles that lie completely outside the viewport are skipped.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             figure_start: tuple[int, int], starting point of the figure
             task_height: int, height of a task
             task_width: int, width of a task
             start_column: str, column of the data to be drawn
             end_column: str, column of the data to be drawn
             plan: bool, if True, the plan is drawn, if False, the actual data is drawn
-
-        Returns:
-            QImage: graph layer
+            viewport: QRect, visible area of the canvas, if None, no rectangle is skipped
         """
-        painter = QPainter()
-        graph_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter.begin(graph_layer)
+        painter.save()
         painter.setPen(self.task_properties.pen)
         painter.setBrush(self.task_properties.brush)
         self.set_painter_renderoptions(painter)
-        for i, task in enumerate(self._loader.data.itertuples()):
-            pen = painter.pen()
-            pen.setColor(QColor(_colors[i % len(_colors)]))
+        task_rects, color_indices = self._task_rects(figure_start, task_height, task_width, start_column, end_column,
+                                                     viewport)
+        rects_by_color: dict[int, list[QRect]] = {}
+        for color_index, rect in zip(color_indices, task_rects):
+            if rect is not None:
+                rects_by_color.setdefault(color_index, []).append(rect)
+        for color_index, rects in rects_by_color.items():
+            pen, brush = self.task_properties.task_style(color_index, plan)
             painter.setPen(pen)
-            brush_color = QColor(_colors[i % len(_colors)])
-            if plan:
-                brush_color.setAlpha(self.task_properties.alpha_plan)
-            else:
-                brush_color.setAlpha(self.task_properties.alpha_actual)
-            brush = painter.brush()
-            brush.setColor(brush_color)
             painter.setBrush(brush)
-            plan_start = self._loader.data[start_column][i].date()
-            plan_end = self._loader.data[end_column][i].date()
-            x_start = figure_start[0] + task_width * (
-                    plan_start - self.start_date).days + self.render_metrics.horizontal_padding
-            x_end = figure_start[0] + task_width * (
-                    plan_end - self.start_date).days + self.render_metrics.horizontal_padding
-            width = x_end - x_start + task_width
-            y = figure_start[1] + self.render_metrics.vertical_padding + i * task_height
-            painter.drawRect(x_start, y, width, task_height)
-        painter.end()
-        return graph_layer
-
-    def draw_grid_layer(self, figure_start, task_width, task_height, figure_width, column):
+            painter.drawRects(rects)
+        painter.restore()
+
+    def draw_data_layers_combined(self, painter: QPainter, figure_start: tuple[int, int], task_height: int,
+                                  task_width: int, viewport: QRect | None = None):
+        """
+        Method that draws the planned and the actual tasks of the Gantt chart in one pass.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
+        Tasks whose actual start and end equal the planned ones are drawn once with the merged style
+        from the task_properties instead of twice on top of each other.
+        All other tasks get a planned and an actual rectangle like two calls of draw_tasks would draw.
+        The planned rectangles are drawn first, then per color the merged and the actual ones.
+        Rectangles sharing a color and kind are drawn with a single drawRects call.
+        Rectangles that lie completely outside the viewport are skipped.
+
+        Parameters:
+            painter: QPainter, painter that is active on the canvas image
+            figure_start: tuple[int, int], starting point of the figure
+            task_height: int, height of a task
+            task_width: int, width of a task
+            viewport: QRect, visible area of the canvas, if None, no rectangle is skipped
+        """
+        plan_rects, color_indices = self._task_rects(figure_start, task_height, task_width, 'Plan-Start', 'Plan-End',
+                                                     viewport)
+        actual_rects, _ = self._task_rects(figure_start, task_height, task_width, 'Actual-Start', 'Actual-End',
+                                           viewport)
+        on_plan = ((self._day_offsets('Plan-Start') == self._day_offsets('Actual-Start'))
+                   & (self._day_offsets('Plan-End') == self._day_offsets('Actual-End'))).tolist()
+        n_colors = len(_colors)
+        buckets: dict[tuple[str, int], list[QRect]] = {}
+        bucket = buckets.setdefault
+        for color_index, plan_rect, actual_rect, same in zip(color_indices, plan_rects, actual_rects, on_plan):
+            if same:
+                if plan_rect is not None:
+                    bucket(('merged', color_index), []).append(plan_rect)
+                continue
+            if plan_rect is not None:
+                bucket(('plan', color_index), []).append(plan_rect)
+            if actual_rect is not None:
+                bucket(('actual', color_index), []).append(actual_rect)
+        styles = {
+            'plan': lambda index: self.task_properties.task_style(index, True),
+            'merged': self.task_properties.merged_task_style,
+            'actual': lambda index: self.task_properties.task_style(index, False),
+        }
+        passes = ([('plan', color_index) for color_index in range(n_colors)]
+                  + [(kind, color_index) for color_index in range(n_colors) for kind in ('merged', 'actual')])
+        painter.save()
+        self.set_painter_renderoptions(painter)
+        for kind, color_index in passes:
+            rects = buckets.get((kind, color_index))
+            if rects:
+                pen, brush = styles[kind](color_index)
+                painter.setPen(pen)
+                painter.setBrush(brush)
+                painter.drawRects(rects)
+        painter.restore()
+
+    def _task_rects(self, figure_start: tuple[int, int], task_height: int, task_width: int, start_column: str,
+                    end_column: str, viewport: QRect | None = None) -> tuple[list[QRect | None], list[int]]:
+        """
+        Method that returns a rectangle and the palette index for each task.
+        Tasks outside the viewport or without a start or end date get None instead of a rectangle,
+        so rows keep their position in the list.
+        Small charts are computed row by row, larger ones with _compute_rects.
+        """
+        if len(self._loader.data) < _SMALL_TASK_COUNT:
+            return self._task_rects_small(figure_start, task_height, task_width, start_column, end_column, viewport)
+        # tasks without a start or end date get no rectangle, their offsets are replaced before the geometry is built
+        dated = ~(self._missing_days(start_column) | self._missing_days(end_column))
+        xs, ys, widths, color_indices = _compute_rects(
+            np.where(dated, self._day_offsets(start_column), 0), np.where(dated, self._day_offsets(end_column), 0),
+            task_width, task_height, figure_start[0], figure_start[1], self.render_metrics.horizontal_padding,
+            self.render_metrics.vertical_padding, len(_colors))
+        if viewport is None:
+            visible = dated.tolist()
+        else:
+            visible = (dated & (xs + widths >= viewport.left()) & (xs <= viewport.right())
+                       & (ys + task_height >= viewport.top()) & (ys <= viewport.bottom())).tolist()
+        rects = [QRect(x, y, width, task_height) if shown else None
+                 for x, y, width, shown in zip(xs.tolist(), ys.tolist(), widths.tolist(), visible)]
+        return rects, color_indices.tolist()
+
+    def _task_rects_small(self, figure_start: tuple[int, int], task_height: int, task_width: int, start_column: str,
+                          end_column: str, viewport: QRect | None = None) -> tuple[list[QRect | None], list[int]]:
+        """
+        Method that returns the same rectangles and palette indices as _task_rects, computed row by row.
+        """
+        x0 = figure_start[0] + self.render_metrics.horizontal_padding
+        y = figure_start[1] + self.render_metrics.vertical_padding
+        n_colors = len(_colors)
+        rects: list[QRect | None] = []
+        color_indices: list[int] = []
+        undated = (self._missing_days(start_column) | self._missing_days(end_column)).tolist()
+        for row, (first, last, missing) in enumerate(zip(self._day_offsets(start_column).tolist(),
+                                                         self._day_offsets(end_column).tolist(), undated)):
+            x = x0 + task_width * first
+            width = task_width * (last - first + 1)
+            if missing:
+                rects.append(None)
+            elif viewport is None or (x + width >= viewport.left() and x <= viewport.right()
+                                      and y + task_height >= viewport.top() and y <= viewport.bottom()):
+                rects.append(QRect(x, y, width, task_height))
+            else:
+                rects.append(None)
+            color_indices.append(row % n_colors)
+            y += task_height
+        return rects, color_indices
+
+    def draw_grid_layer(self, painter: QPainter, figure_start, task_width, task_height, figure_width, column):
         """
         Method that draws the grid of the Gantt chart.
-        Creates a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with color, pen and brush from the grid_properties and set hints for rendering.
         A range depending of the maximum date in the data and the start date is calculated.
-        While iterating over this range a vertical line for each day is drawn.
-        For horizontal lines the number of tasks is determined by the length of the dataframe. The horizontal lines are
+        For this range a vertical line for each day is drawn.
+        For horizontal lines the number of tasks is determined by the length of the dataframe. A horizontal line is
         drawn for each task.
+        Both groups of lines are regular, so each is stamped with drawTiledPixmap from a cached tile holding one line.
+        Lines wider than one pixel would be cut by the tile edges, so they are drawn with one drawLines call per group.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             figure_start: tuple[int, int], starting point of the figure
             task_width: int, width of a task
             task_height: int, height of a task
             figure_width: int, width of the figure
             column: str, column of the data that is used to determine the maximum date
-
-        Returns:
-            QImage: grid layer
         """
-        grid_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter = QPainter()
-        painter.begin(grid_layer)
+        painter.save()
         painter.setPen(self.grid_properties.pen)
         painter.setBrush(self.grid_properties.brush)
         self.set_painter_renderoptions(painter)
 
+        fx, fy = figure_start
+        vpad = self.render_metrics.vertical_padding
+
+        days = self._last_day(column) + 2
+        x = fx + self.render_metrics.horizontal_padding
+        top = fy
+        bottom = self.canvas_size[1] - vpad
+        y = fy + vpad
+        left = int(fx - self.render_metrics.legend_width)
+        right = fx + figure_width
+        rows = len(self._loader.data)
+        if self.grid_properties.pen.widthF() > 1:
+            # a wider line would be cut at the tile edges, so the lines are drawn one by one in a single call each
+            painter.drawLines([QLine(line_x, top, line_x, bottom)
+                               for line_x in (x + np.arange(days) * task_width).tolist()])
+            painter.drawLines([QLine(left, line_y, right, line_y)
+                               for line_y in (y + np.arange(rows + 1) * task_height).tolist()])
+            painter.restore()
+            return
+
         # draw vertical lines
-        for i in range((self._loader.data[column].max().date() - self.start_date).days + 2):
-            x = figure_start[0] + i * task_width + self.render_metrics.horizontal_padding
-            painter.drawLine(x, figure_start[1], x, self.canvas_size[1] - self.render_metrics.vertical_padding)
+        tile = self._grid_tile(task_width, bottom - top + 1, vertical=True)
+        painter.drawTiledPixmap(QRect(x, top, (days - 1) * task_width + 1, tile.height()), tile)
 
         # draw horizontal lines
-        for i in range(len(self._loader.data) + 1):
-            y = figure_start[1] + self.render_metrics.vertical_padding + i * task_height
-            painter.drawLine(
-                figure_start[0] - self.render_metrics.legend_width, y,
-                figure_start[0] + figure_width, y)
-        painter.end()
-        return grid_layer
+        tile = self._grid_tile(right - left + 1, task_height, vertical=False)
+        painter.drawTiledPixmap(QRect(left, y, tile.width(), rows * task_height + 1), tile)
+        painter.restore()
+
+    def _grid_tile(self, width: int, height: int, vertical: bool) -> QPixmap:
+        """
+        Method that returns a transparent tile holding a single grid line along its left or top edge.
+        Only the tile of the last size and grid pen is kept for each direction.
+
+        Parameters:
+            width: int, width of the tile
+            height: int, height of the tile
+            vertical: bool, if True, the line runs along the left edge, otherwise along the top edge
 
-    def draw_box_layer(self, figure_start, width, height):
+        Returns:
+            QPixmap: grid tile
+        """
+        pen = self.grid_properties.pen
+        key = (width, height, vertical, pen.color().rgba(), pen.widthF(), pen.style())
+        cached = self._grid_tile_cache.get(vertical)
+        tile = cached[1] if cached is not None and cached[0] == key else None
+        if tile is None:
+            tile = QPixmap(width, height)
+            tile.fill(Qt.GlobalColor.transparent)
+            painter = QPainter()
+            painter.begin(tile)
+            painter.setPen(pen)
+            self.set_painter_renderoptions(painter)
+            if vertical:
+                painter.drawLine(0, 0, 0, height - 1)
+            else:
+                painter.drawLine(0, 0, width - 1, 0)
+            painter.end()
+            self._grid_tile_cache[vertical] = (key, tile)
+        return tile
+
+    def draw_box_layer(self, painter: QPainter, figure_start, width, height):
         """
         Method that draws the box of the Gantt chart.
-        First initializes a QPainter object.
-        Second initialize a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with color, pen and brush from the box_properties and set hints for rendering.
         Draw the box rectangle.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             figure_start: tuple[int, int], starting point of the figure
             width: int, width of the box
             height: int, height of the box
-
-        Returns:
-            QImage: box layer
         """
-        painter = QPainter()
-        box_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter.begin(box_layer)
+        painter.save()
         painter.setPen(self.box_properties.pen)
         painter.setBrush(self.box_properties.brush)
         self.set_painter_renderoptions(painter)
@@ -1010,22 +1668,19 @@ class Figure:
             width,
             height
         )
-        painter.end()
-        return box_layer
+        painter.restore()
 
-    def draw_title(self):
+    def draw_title(self, painter: QPainter):
         """
         Method that draws the title of the Gantt chart.
-        First initializes a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with color, pen and brush from the title_properties and set hints for rendering.
         Draw the title text using dimensions from the render_metrics.
 
-        Returns:
-            QImage: title layer
+        Parameters:
+            painter: QPainter, painter that is active on the canvas image
         """
-        painter = QPainter()
-        title_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter.begin(title_layer)
+        painter.save()
         painter.setPen(self.title_properties.pen)
         painter.setFont(self.title_properties.font)
         painter.setBrush(self.title_properties.brush)
@@ -1037,47 +1692,152 @@ class Figure:
             self.render_metrics.title_height,
             Qt.AlignmentFlag.AlignCenter,
             self.title_properties.text)
-        painter.end()
-        return title_layer
+        painter.restore()
 
-    def draw_legend(self, figure_start, task_height):
+    def draw_legend(self, painter: QPainter, figure_start, task_height):
         """
         Method that draws the legend of the Gantt chart.
-        First create a QPainter object and a QImage object using the canvas size.
+        The state of the given painter is saved and restored, so no settings leak into other layers.
         Configure the painter object with color, pen and brush from the legend_properties and set hints for rendering.
         Iterate over the dataframe stored in Dataloader object.
         The vertical starting position of each legend entry is determined by the top edge of the figure box and the task height
         as well as the index in the dataframe.
         The horizontal starting position is determined by the horizontal padding of the render_metrics attribute.
         The height of a legend entry is the task height. The width is determined legend_width from the render_metrics attribute.
+        Entries are drawn as static texts built once per loaded data, right aligned and clipped to their entry.
 
         Parameters:
+            painter: QPainter, painter that is active on the canvas image
             figure_start: tuple[int, int], starting point of the figure
             task_height: int, height of a task
-
-        Returns:
-            QImage: legend layer
         """
-        painter = QPainter()
-        legend_layer = QImage(self.canvas_size[0], self.canvas_size[1], QImage.Format.Format_ARGB32)
-        painter.begin(legend_layer)
+        painter.save()
         painter.setPen(self.legend_properties.pen)
         painter.setBrush(self.legend_properties.brush)
         painter.setFont(self.legend_properties.font)
         self.set_painter_renderoptions(painter)
-        for i, task in enumerate(self._loader.data.itertuples()):
-            y = figure_start[1] + self.render_metrics.vertical_padding + i * task_height
-            x = self.render_metrics.horizontal_padding
-            painter.drawText(
-                x,
-                y,
-                self.render_metrics.legend_width,
-                task_height,
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                self._loader.data['Task'][i] + ": " + self._loader.data['Description'][i],
-            )
-        painter.end()
-        return legend_layer
+        labels, label_widths = self._legend_labels(painter)
+        ys = (figure_start[1] + self.render_metrics.vertical_padding + np.arange(len(labels)) * task_height).tolist()
+        x = self.render_metrics.horizontal_padding
+        width = self.render_metrics.legend_width
+        # labels are right aligned and vertically centered, measured on the canvas like drawStaticText lays them out
+        metrics = _font_metrics(self.legend_properties.font, painter.device())
+        top_offset = (task_height - _line_height(metrics)) / 2
+        for y, label, label_width in zip(ys, labels, label_widths):
+            painter.setClipRect(x, y, width, task_height)
+            painter.drawStaticText(QPointF(x + width - label_width, y + top_offset), label)
+        painter.setClipping(False)
+        painter.restore()
+
+    def _legend_labels(self, painter: QPainter) -> tuple[list[QStaticText], list[float]]:
+        """
+        Method that returns the legend label of each task as static text together with its width on the canvas.
+        Labels are built once per loaded data and legend font and dropped by reset.
+
+        Parameters:
+            painter: QPainter, painter that is active on the canvas image
+
+        Returns:
+            tuple[list[QStaticText], list[float]]: static text and width of each label
+        """
+        font = self.legend_properties.font
+        device = painter.device()
+        source = (id(self._loader), self._loader._version, font.key(), device.logicalDpiX(), device.logicalDpiY())
+        if source != self._legend_source:
+            texts = [f"{task}: {description}" for task, description in
+                     zip(self._loader.data['Task'].tolist(), self._loader.data['Description'].tolist())]
+            metrics = _font_metrics(font, device)
+            self._legend_static = [_new_static_text(text) for text in texts]
+            self._legend_sizes = [metrics.horizontalAdvance(text) for text in texts]
+            self._legend_source = source
+        return self._legend_static, self._legend_sizes
+
+    def _cached(self, kind: str, column: str, compute):
+        """
+        Method that caches values derived from a data column.
+        The cache is dropped when another loader is drawn, the data is reloaded or the start date changes.
+
+        Parameters:
+            kind: str, name of the derived value
+            column: str, column of the data
+            compute: callable that derives the value from the column
+
+        Returns:
+            the cached value
+        """
+        source = (id(self._loader), self._loader._version, self.start_date)
+        if source != self._data_cache_source:
+            self._data_cache.clear()
+            self._data_cache_source = source
+        key = (kind, column)
+        if key not in self._data_cache:
+            self._data_cache[key] = compute(self._loader.data[column])
+        return self._data_cache[key]
+
+    def _last_day(self, column: str) -> int:
+        """
+        Method that returns the latest date of a column as days since the start date.
+
+        Parameters:
+            column: str, column of the data
+
+        Returns:
+            int: day offset of the latest date in the column
+        """
+        return self._cached('last_day', column, lambda values: int(self._day_offsets(column).max()))
+
+    def _day_offsets(self, column: str) -> np.ndarray:
+        """
+        Method that returns the dates of a column as days since the start date.
+
+        Parameters:
+            column: str, column of the data
+
+        Returns:
+            np.ndarray: integer day offsets
+        """
+        start_date = np.datetime64(self.start_date, 'D')
+        return self._cached('day_offsets', column,
+                            lambda values: (values.to_numpy().astype('datetime64[D]') - start_date).astype(np.int64))
+
+    def _missing_days(self, column: str) -> np.ndarray:
+        """
+        Method that returns which dates of a column are empty, e.g. the actual dates of a task not started yet.
+        The day offsets of these rows hold no valid day and must not be drawn.
+
+        Parameters:
+            column: str, column of the data
+
+        Returns:
+            np.ndarray: True for each row without a date
+        """
+        return self._cached('missing_days', column, lambda values: np.isnat(values.to_numpy().astype('datetime64[D]')))
+
+    def _predecessor_lists(self) -> list[list[str]]:
+        """
+        Method that returns the predecessors of each task, split once per loaded data.
+
+        Returns:
+            list[list[str]]: predecessors of each task, empty if the cell is empty
+        """
+        return self._cached('predecessor_lists', 'Predecessor',
+                            lambda values: [[] if pd.isna(value) else str(value).split(';') for value in values.tolist()])
+
+    def _month_days(self, column: str) -> np.ndarray:
+        """
+        Method that returns the day of the month for each day from the start date to the latest date of a column.
+        The axis and the time hints share this calendar, so it is derived once per data and start date.
+
+        Parameters:
+            column: str, column of the data
+
+        Returns:
+            np.ndarray: day of the month of each day in the range, starting at 1
+        """
+        def compute(values):
+            calendar = np.datetime64(self.start_date, 'D') + np.arange(self._last_day(column) + 1)
+            return (calendar - calendar.astype('datetime64[M]')).astype(np.int64) + 1
+        return self._cached('month_days', column, compute)
 
     def _define_task_height(self, height) -> int:
         if self.canvas_size is None:
@@ -1092,8 +1852,7 @@ class Figure:
         if self.canvas_size is None:
             raise ValueError("canvas_size not set")
         av_width = width - 2 * self.render_metrics.horizontal_padding
-        time_span = self._loader.data['Plan-End'].max().date() - self.start_date
-        time_span = int(time_span.days)
+        time_span = self._last_day('Plan-End')
         if int(av_width / time_span) < 1:
             raise ValueError("Canvas too small for all tasks or RenderMetrics inappropriately set")
         return int(av_width / time_span)